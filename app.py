@@ -1,15 +1,28 @@
 import os
 import atexit
+import importlib
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
 from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
-from services.logger_service import app_logger
 
-# Load environment variables
+# Load environment variables before the logger reads its configuration at import
 load_dotenv()
 
+from services.logger_service import app_logger
+
+# Blueprints registered by create_app: (module, blueprint attribute, URL prefix)
+_BLUEPRINTS = (
+    ('api.twilio_routes', 'twilio_bp', '/api'),
+    ('api.user_routes', 'user_bp', '/api/users'),
+    ('api.call_routes', 'call_bp', '/api/calls'),
+    ('api.admin_routes', 'admin_bp', '/api/admin'),
+    ('api.contact_routes', 'contact_bp', '/api/contacts'),
+    ('api.update_routes', 'update_bp', '/api/updates'),
+    ('api.remote_routes', 'remote_bp', '/api/remote'),
+)
+
 def create_app():
     app = Flask(__name__)
     
@@ -19,6 +32,10 @@ def create_app():
     # x_proto=1: trust 1 proxy for X-Forwarded-Proto header
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
     
+    # Flag health checks and static assets so the logging hooks can skip them cheaply
+    from middleware.logging_middleware import MaybeSkipLoggingMiddleware
+    app.wsgi_app = MaybeSkipLoggingMiddleware(app.wsgi_app)
+    
     # Enable CORS
     CORS(app)
     
@@ -26,8 +43,10 @@ def create_app():
     from middleware.logging_middleware import setup_logging_middleware
     setup_logging_middleware(app)
     
-    # Initialize SocketIO
-    socketio = SocketIO(app, cors_allowed_origins="*", logger=True, engineio_logger=True)
+    # Initialize SocketIO (per-frame Socket.IO/Engine.IO logging is opt-in for debugging)
+    socketio = SocketIO(app, cors_allowed_origins="*",
+                        logger=os.getenv('SOCKETIO_LOG', '0') == '1',
+                        engineio_logger=os.getenv('ENGINEIO_LOG', '0') == '1')
     
     # Add basic routes
     @app.route('/')
@@ -38,25 +57,21 @@ def create_app():
     def health():
         return {'status': 'healthy', 'server': 'SmartTV'}
     
-    # Register blueprints
-    from api.twilio_routes import twilio_bp
-    from api.user_routes import user_bp
-    from api.call_routes import call_bp
-    from api.admin_routes import admin_bp
-    from api.contact_routes import contact_bp
-    from api.update_routes import update_bp
-    from api.remote_routes import remote_bp, register_socketio_events
-    
-    app.register_blueprint(twilio_bp, url_prefix='/api')
-    app.register_blueprint(user_bp, url_prefix='/api/users')
-    app.register_blueprint(call_bp, url_prefix='/api/calls')
-    app.register_blueprint(admin_bp, url_prefix='/api/admin')
-    app.register_blueprint(contact_bp, url_prefix='/api/contacts')
-    app.register_blueprint(update_bp, url_prefix='/api/updates')
-    app.register_blueprint(remote_bp, url_prefix='/api/remote')
+    # Register blueprints, importing each route module only when it's enabled
+    # ENABLED_BLUEPRINTS (e.g. "user_bp,call_bp") limits which are loaded; default is all
+    enabled_blueprints = os.getenv('ENABLED_BLUEPRINTS')
+    if enabled_blueprints:
+        enabled_blueprints = {name.strip() for name in enabled_blueprints.split(',')}
     
-    # Register SocketIO events for mobile remote control
-    register_socketio_events(socketio)
+    for module_name, blueprint_name, url_prefix in _BLUEPRINTS:
+        if enabled_blueprints and blueprint_name not in enabled_blueprints:
+            continue
+        module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, blueprint_name), url_prefix=url_prefix)
+        
+        # Register SocketIO events for mobile remote control
+        if hasattr(module, 'register_socketio_events'):
+            module.register_socketio_events(socketio)
     
     # Start background service
     from services.background_service import background_service
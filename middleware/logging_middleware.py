@@ -1,65 +1,107 @@
 import time
-import json
+import logging
+import orjson
 from flask import request, g
 from functools import wraps
 from services.logger_service import app_logger
 from utils.ip_utils import get_client_ip, get_ip_info
 
+# Paths that are never logged (health checks from load balancers, landing page)
+_SKIP_PATHS = frozenset({'/', '/health'})
+
+# Request body keys that are never written to the logs
+_SENSITIVE = frozenset({'password', 'token', 'secret', 'key', 'auth_token', 'api_key'})
+
+# Only JSON bodies of these methods, and below this size, are logged
+_BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+_MAX_LOGGED_BODY_BYTES = 64 * 1024
+_MAX_LOGGED_BODY_KEYS = 50
+
+def _is_skipped_path(path):
+    """Check whether a path is exempt from request logging"""
+    return path in _SKIP_PATHS or path.startswith('/static')
+
+def _skip_logging():
+    """Check whether the current request is exempt from request logging"""
+    skip = request.environ.get('_skip_log')
+    if skip is None:  # App isn't wrapped with MaybeSkipLoggingMiddleware
+        skip = _is_skipped_path(request.path)
+    return skip
+
+class MaybeSkipLoggingMiddleware:
+    """WSGI middleware that flags unlogged paths before Flask handles the request"""
+    
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        environ['_skip_log'] = _is_skipped_path(environ.get('PATH_INFO', ''))
+        return self.wsgi_app(environ, start_response)
+
 def log_api_requests(app):
     """Middleware to log all API requests and responses"""
     
     @app.before_request
     def before_request():
         """Log incoming requests"""
+        # Skip logging for health checks and static assets before doing any work
+        if _skip_logging():
+            return
+        
         g.start_time = time.time()
         
         # Get client IP and store it in g for use across the request
-        g.client_ip = get_client_ip()
+        # ProxyFix has already resolved X-Forwarded-For into remote_addr
+        g.client_ip = request.remote_addr or 'unknown'
         g.ip_info = get_ip_info(g.client_ip)
         
-        # Skip logging for health checks and static assets
-        if request.endpoint in ['health', 'home'] or request.path.startswith('/static'):
+        # Don't assemble the request details if INFO records are filtered out
+        if not app_logger.is_enabled_for(logging.INFO):
             return
         
+        # Read headers straight from the WSGI environ, skipping the Headers wrapper
+        environ = request.environ
+        referer = environ.get('HTTP_REFERER')
+        
         # Log basic request info
         request_data = {
             'method': request.method,
             'endpoint': request.path,
             'client_ip': g.client_ip,
-            'ip_type': g.ip_info.get('type', 'unknown'),
-            'user_agent': request.headers.get('User-Agent', 'Unknown')[:200],  # Limit length
-            'referer': request.headers.get('Referer', '')[:100] if request.headers.get('Referer') else None
+            'ip_type': g.ip_info.type,
+            'user_agent': (environ.get('HTTP_USER_AGENT') or 'Unknown')[:200],  # Limit length
+            'referer': referer[:100] if referer else None
         }
         
         # Add IP version info if available
-        if 'version' in g.ip_info:
-            request_data['ip_version'] = f"IPv{g.ip_info['version']}"
+        if g.ip_info.version:
+            request_data['ip_version'] = f"IPv{g.ip_info.version}"
         
-        # Add query parameters if present
-        if request.args:
-            request_data['query_params'] = dict(request.args)
+        # Add the raw query string if present (parsed lazily by views that need it)
+        if request.query_string:
+            request_data['query_string'] = request.query_string.decode('latin-1')
         
         # Add JSON body for POST/PUT requests (but don't log sensitive data)
-        if request.method in ['POST', 'PUT', 'PATCH'] and request.is_json:
-            try:
-                body = request.get_json()
+        if (request.method in _BODY_METHODS and request.is_json
+                and request.content_length and request.content_length < _MAX_LOGGED_BODY_BYTES):
+            # Parsed once and cached on the request, so the view reuses it
+            body = request.get_json(silent=True)
+            if body and isinstance(body, dict) and len(body) <= _MAX_LOGGED_BODY_KEYS:
+                # Filter out sensitive fields, copying only when one is present
+                if not _SENSITIVE.isdisjoint(k.lower() for k in body):
+                    body = {k: v for k, v in body.items() if k.lower() not in _SENSITIVE}
                 if body:
-                    # Filter out sensitive fields
-                    filtered_body = {k: v for k, v in body.items() 
-                                   if k.lower() not in ['password', 'token', 'secret', 'key', 'auth_token', 'api_key']}
-                    if filtered_body:
-                        request_data['body'] = filtered_body
-            except Exception:
-                pass
+                    request_data['body'] = body
         
-        app_logger.info(f"API Request: {request.method} {request.path} from {g.client_ip}", extra_data=request_data)
+        app_logger.info("API Request: %s %s from %s", request.method, request.path, g.client_ip,
+                        extra_data=request_data)
     
     @app.after_request
     def after_request(response):
         """Log outgoing responses"""
         
         # Skip logging for health checks and static assets
-        if request.endpoint in ['health', 'home'] or request.path.startswith('/static'):
+        if _skip_logging():
             return response
         
         # Calculate response time
@@ -81,21 +123,21 @@ def log_api_requests(app):
         
         # Log errors with more detail
         if response.status_code >= 400:
-            ip_info = getattr(g, 'ip_info', {})
+            ip_info = getattr(g, 'ip_info', None)
             error_data = {
                 'status_code': response.status_code,
                 'method': request.method,
                 'endpoint': request.path,
                 'client_ip': client_ip,
-                'ip_type': ip_info.get('type', 'unknown'),
+                'ip_type': ip_info.type if ip_info else 'unknown',
                 'response_time_ms': response_time
             }
             
             # Try to get error message from response
             try:
-                if response.is_json:
-                    response_data = response.get_json()
-                    if response_data and 'error' in response_data:
+                if response.mimetype == 'application/json':
+                    response_data = orjson.loads(response.get_data())
+                    if isinstance(response_data, dict) and 'error' in response_data:
                         error_data['error_message'] = response_data['error']
             except Exception:
                 pass
@@ -116,8 +158,12 @@ def log_exceptions(app):
     @app.errorhandler(Exception)
     def handle_exception(e):
         """Log unhandled exceptions"""
-        client_ip = getattr(g, 'client_ip', get_client_ip())
-        ip_info = getattr(g, 'ip_info', get_ip_info(client_ip))
+        # Only resolve the IP here if before_request didn't already (or skipped the request)
+        if 'client_ip' in g:
+            client_ip, ip_info = g.client_ip, g.ip_info
+        else:
+            client_ip = get_client_ip()
+            ip_info = get_ip_info(client_ip)
         
         error_data = {
             'exception_type': type(e).__name__,
@@ -125,11 +171,12 @@ def log_exceptions(app):
             'method': request.method,
             'endpoint': request.path,
             'client_ip': client_ip,
-            'ip_type': ip_info.get('type', 'unknown')
+            'ip_type': ip_info.type
         }
         
         app_logger.critical(
-            f"Unhandled exception in {request.method} {request.path} from {client_ip}: {type(e).__name__}",
+            "Unhandled exception in %s %s from %s: %s",
+            request.method, request.path, client_ip, type(e).__name__,
             extra_data=error_data,
             send_to_discord=True
         )
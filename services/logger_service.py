@@ -1,11 +1,149 @@
 import os
 import json
+import math
+import queue
+import atexit
 import logging
+import time
+import threading
+import orjson
 import requests
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, WatchedFileHandler, QueueHandler, QueueListener
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 
+# Pending Discord embeds, delivered by a background worker so webhook
+# latency never blocks the request thread
+_discord_queue = queue.Queue(maxsize=1000)
+_DISCORD_SENTINEL = object()
+
+# Shared keep-alive session for webhook posts; only the worker thread sends,
+# so a single pooled connection stays warm across batches.
+# Retries cover connection failures and 5xx only: Retry-After (429) is handled
+# by the worker with its own cap, and a read timeout may mean Discord already
+# accepted the POST, so retrying it would duplicate the alert.
+_discord_session = requests.Session()
+_discord_adapter = HTTPAdapter(
+    pool_connections=1, pool_maxsize=1,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=frozenset({'POST'}), respect_retry_after_header=False)
+)
+_discord_session.mount('https://', _discord_adapter)
+_discord_session.mount('http://', _discord_adapter)
+
+# Discord webhook limits: 10 embeds per message, 6000 characters across them
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_EMBED_CHARS = 6000
+
+# How long the worker waits for more embeds before posting a batch (seconds)
+DISCORD_BATCH_WINDOW = 0.2
+
+# Upper bound on how long the worker waits out a Discord rate limit
+DISCORD_MAX_RETRY_AFTER = 60
+
+# Colors and emojis for the different log levels
+_LEVEL_CONFIG = {
+    'INFO': {'color': 0x3498db, 'emoji': '🔵', 'name': 'Information'},      # Blue
+    'WARNING': {'color': 0xf39c12, 'emoji': '🟠', 'name': 'Warning'},     # Orange  
+    'ERROR': {'color': 0xe74c3c, 'emoji': '🔴', 'name': 'Error'},         # Red
+    'CRITICAL': {'color': 0x8b0000, 'emoji': '🔥', 'name': 'Critical'}    # Dark Red
+}
+
+# Embed field grouping by extra_data key
+_CODE_KEYS = frozenset({'client_ip', 'user_id', 'endpoint', 'method', 'status_code'})
+_REQUEST_KEYS = frozenset({'client_ip', 'ip_type', 'ip_version', 'remote_addr',
+                           'endpoint', 'method', 'status_code', 'response_time_ms'})
+_USER_KEYS = frozenset({'user_id', 'action', 'device_type'})
+_ERROR_KEYS = frozenset({'exception_type', 'exception_message', 'error_message', 'error_type'})
+_SEPARATOR = {"name": "\u200b", "value": "\u200b", "inline": False}
+
+# log_system_event level names; anything else logs at INFO
+_SYSTEM_EVENT_LEVELS = {
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL
+}
+
+# Embeds with at most this many extra_data keys are not grouped
+MAX_UNGROUPED_FIELDS = 6
+
+def _embed_field(key: str, value: Any) -> Dict[str, Any]:
+    """Build an inline embed field from an extra_data entry"""
+    field_value = str(value)
+    
+    # Truncate long values but show truncation
+    if len(field_value) > 1000:
+        field_value = field_value[:997] + "..."
+    
+    return {
+        "name": key.replace('_', ' ').title(),
+        "value": f"`{field_value}`" if key in _CODE_KEYS else field_value,
+        "inline": True
+    }
+
+# app.log buffer size (characters) and how often buffered records are flushed to disk
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 1.0
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to JSON with orjson, falling back to json for values it rejects (e.g. lone surrogates)"""
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj).encode()
+
+def _header_seconds(response, header: str, default: float) -> float:
+    """Read a rate-limit delay header, capped at DISCORD_MAX_RETRY_AFTER"""
+    try:
+        seconds = float(response.headers.get(header, default))
+    except ValueError:
+        seconds = default
+    if not math.isfinite(seconds):
+        seconds = default
+    return min(max(seconds, 0), DISCORD_MAX_RETRY_AFTER)
+
+class BufferedWatchedFileHandler(WatchedFileHandler):
+    """WatchedFileHandler that buffers records, flushing immediately only for ERROR and above"""
+    
+    def __init__(self, filename: str, buffer_size: int = LOG_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._pending = []
+        self._pending_size = 0
+        super().__init__(filename)
+    
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            self._pending.append(line)
+            self._pending_size += len(line)
+            if record.levelno >= logging.ERROR or self._pending_size >= self.buffer_size:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        # Buffered records go out in a single write that ends on a record boundary,
+        # so lines appended to the same file by other worker processes never interleave
+        self.acquire()
+        try:
+            if self._pending:
+                data = ''.join(self._pending)
+                self._pending.clear()
+                self._pending_size = 0
+                self.reopenIfNeeded()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(data)
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+        finally:
+            self.release()
+
 class DiscordLogger:
     """Enhanced logging service with file storage and Discord webhook integration"""
     
@@ -25,19 +163,28 @@ class DiscordLogger:
         self.logger = logging.getLogger('smarttv_app')
         self.logger.setLevel(logging.INFO)
         
-        # Add file handler to main logger
+        # Route records through the queue; the listener thread does the file I/O
         if not self.logger.handlers:
-            self.logger.addHandler(self.file_handler)
-            self.logger.addHandler(self.error_handler)
+            self.logger.addHandler(QueueHandler(self._log_queue))
+        
+        # Start the Discord delivery worker (only when a webhook is configured)
+        self._discord_enabled = bool(self.discord_webhook_url)
+        self._queue = _discord_queue
+        self.discord_dropped = 0
+        if self._discord_enabled:
+            self._http = _discord_session
+            self._discord_thread = threading.Thread(target=self._discord_worker, name='discord-logger', daemon=True)
+            self._discord_thread.start()
+            atexit.register(self._stop_discord_worker)
     
     def _setup_file_logging(self):
-        """Set up rotating file handlers for different log levels"""
+        """Set up file handlers, written by a background queue listener"""
+        self._log_queue = queue.Queue(-1)
         
-        # General application logs (all levels)
+        # General application logs (all levels); rotated externally by logrotate,
+        # the handler reopens the file when it's moved or truncated
         log_file = os.path.join(self.logs_dir, 'app.log')
-        self.file_handler = RotatingFileHandler(
-            log_file, maxBytes=10*1024*1024, backupCount=5  # 10MB files, keep 5 backups
-        )
+        self.file_handler = BufferedWatchedFileHandler(log_file)
         self.file_handler.setLevel(logging.INFO)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
@@ -48,25 +195,50 @@ class DiscordLogger:
         # Error logs (ERROR and CRITICAL only)
         error_log_file = os.path.join(self.logs_dir, 'errors.log')
         self.error_handler = RotatingFileHandler(
-            error_log_file, maxBytes=5*1024*1024, backupCount=3  # 5MB files, keep 3 backups
+            error_log_file, maxBytes=50*1024*1024, backupCount=3  # 50MB files, keep 3 backups
         )
         self.error_handler.setLevel(logging.ERROR)
         self.error_handler.setFormatter(file_formatter)
-    
-    def _send_to_discord(self, level: str, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Send log message to Discord webhook with enhanced formatting"""
-        if not self.discord_webhook_url:
-            return
         
-        # Define colors and emojis for different log levels
-        level_config = {
-            'INFO': {'color': 0x3498db, 'emoji': '🔵', 'name': 'Information'},      # Blue
-            'WARNING': {'color': 0xf39c12, 'emoji': '🟠', 'name': 'Warning'},     # Orange  
-            'ERROR': {'color': 0xe74c3c, 'emoji': '🔴', 'name': 'Error'},         # Red
-            'CRITICAL': {'color': 0x8b0000, 'emoji': '🔥', 'name': 'Critical'}    # Dark Red
-        }
+        self._listener = QueueListener(
+            self._log_queue, self.file_handler, self.error_handler, respect_handler_level=True
+        )
+        self._listener.start()
         
-        config = level_config.get(level, {'color': 0x95a5a6, 'emoji': '⚪', 'name': level})
+        # Buffered app.log records reach the disk at least every LOG_FLUSH_INTERVAL
+        self._flush_stop = threading.Event()
+        threading.Thread(target=self._flush_file_logs, name='log-flusher', daemon=True).start()
+        
+        # Registered before any create_app() hooks, so it runs after them and
+        # still writes their shutdown logs
+        atexit.register(self._stop_file_logging)
+    
+    def _flush_file_logs(self):
+        """Periodically flush buffered log file writes"""
+        while not self._flush_stop.wait(LOG_FLUSH_INTERVAL):
+            try:
+                self.file_handler.flush()
+            except OSError as e:
+                print(f"Failed to flush app.log: {e}")
+    
+    def flush(self):
+        """Wait for queued records to be written, then flush the log files"""
+        # The listener marks each record done once handled; skip if it's already stopped
+        if not self._flush_stop.is_set():
+            self._log_queue.join()
+        self.file_handler.flush()
+        self.error_handler.flush()
+    
+    def _stop_file_logging(self):
+        """Drain queued records and flush the log files on shutdown"""
+        self._listener.stop()
+        self._flush_stop.set()
+        self.file_handler.flush()
+    
+    def _send_to_discord(self, level: str, message: str, extra_data: Optional[Dict[str, Any]] = None,
+                         timestamp: Optional[str] = None):
+        """Send log message to Discord webhook with enhanced formatting"""
+        config = _LEVEL_CONFIG.get(level) or {'color': 0x95a5a6, 'emoji': '⚪', 'name': level}
         
         # Format the main message with better structure
         description = f"**{message}**"
@@ -76,7 +248,7 @@ class DiscordLogger:
             "title": f"{config['emoji']} {config['name']} Alert",
             "description": description,
             "color": config['color'],
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": (timestamp or datetime.utcnow().isoformat()) + "Z",
             "footer": {
                 "text": f"{self.app_name} • {self.environment.upper()}",
                 "icon_url": "https://cdn.discordapp.com/emojis/1234567890123456789.png" if level == 'CRITICAL' else None
@@ -85,7 +257,13 @@ class DiscordLogger:
         }
         
         # Add structured fields based on data type
-        if extra_data:
+        if extra_data and len(extra_data) <= MAX_UNGROUPED_FIELDS:
+            # Small payloads read fine as-is; skip grouping and separators
+            for key, value in extra_data.items():
+                if value:  # Skip empty values
+                    embed["fields"].append(_embed_field(key, value))
+        
+        elif extra_data:
             # Group related fields
             system_fields = []
             request_fields = []
@@ -95,29 +273,16 @@ class DiscordLogger:
             for key, value in extra_data.items():
                 if not value:  # Skip empty values
                     continue
-                    
-                field_name = key.replace('_', ' ').title()
-                field_value = str(value)
-                
-                # Truncate long values but show truncation
-                if len(field_value) > 1000:
-                    field_value = field_value[:997] + "..."
                 
-                field = {
-                    "name": field_name,
-                    "value": f"`{field_value}`" if key in ['client_ip', 'user_id', 'endpoint', 'method', 'status_code'] else field_value,
-                    "inline": True
-                }
+                field = _embed_field(key, value)
                 
                 # Categorize fields
-                if key in ['client_ip', 'ip_type', 'ip_version', 'remote_addr']:
+                if key in _REQUEST_KEYS:
                     request_fields.append(field)
-                elif key in ['user_id', 'action', 'device_type']:
+                elif key in _USER_KEYS:
                     user_fields.append(field)
-                elif key in ['exception_type', 'exception_message', 'error_message', 'error_type']:
+                elif key in _ERROR_KEYS:
                     error_fields.append(field)
-                elif key in ['endpoint', 'method', 'status_code', 'response_time_ms']:
-                    request_fields.append(field)
                 else:
                     system_fields.append(field)
             
@@ -125,17 +290,17 @@ class DiscordLogger:
             if user_fields:
                 embed["fields"].extend(user_fields)
                 if request_fields or error_fields or system_fields:
-                    embed["fields"].append({"name": "\u200b", "value": "\u200b", "inline": False})  # Separator
+                    embed["fields"].append(_SEPARATOR)
             
             if request_fields:
                 embed["fields"].extend(request_fields)
                 if error_fields or system_fields:
-                    embed["fields"].append({"name": "\u200b", "value": "\u200b", "inline": False})  # Separator
+                    embed["fields"].append(_SEPARATOR)
             
             if error_fields:
                 embed["fields"].extend(error_fields)
                 if system_fields:
-                    embed["fields"].append({"name": "\u200b", "value": "\u200b", "inline": False})  # Separator
+                    embed["fields"].append(_SEPARATOR)
             
             if system_fields:
                 embed["fields"].extend(system_fields)
@@ -148,126 +313,229 @@ class DiscordLogger:
                 "inline": True
             })
         
+        try:
+            self._queue.put_nowait((level, embed))
+        except queue.Full:
+            # Never block the caller; drop the alert instead
+            self.discord_dropped += 1
+    
+    def _discord_worker(self):
+        """Deliver queued Discord embeds off the request thread, batching bursts"""
+        carry = None
+        while True:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if item is _DISCORD_SENTINEL:
+                return
+            
+            stopping = False
+            try:
+                # Coalesce embeds arriving within a short window into one webhook call
+                levels = [item[0]]
+                embeds_batch = [item[1]]
+                batch_chars = len(_json_bytes(item[1]))
+                deadline = time.monotonic() + DISCORD_BATCH_WINDOW
+                while len(embeds_batch) < DISCORD_MAX_EMBEDS:
+                    try:
+                        item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is _DISCORD_SENTINEL:
+                        stopping = True
+                        break
+                    try:
+                        embed_chars = len(_json_bytes(item[1]))
+                    except (TypeError, ValueError) as e:
+                        # Unserializable embed: drop it rather than the whole batch
+                        print(f"Failed to send log to Discord: {e}")
+                        self.discord_dropped += 1
+                        continue
+                    if batch_chars + embed_chars > DISCORD_MAX_EMBED_CHARS:
+                        carry = item  # Starts the next batch
+                        break
+                    levels.append(item[0])
+                    embeds_batch.append(item[1])
+                    batch_chars += embed_chars
+                
+                self._post_to_discord(levels, embeds_batch)
+            except Exception as e:
+                # This is the only delivery thread, so one bad batch must not stop it
+                print(f"Failed to send log to Discord: {e}")
+            if stopping:
+                return
+    
+    def _post_to_discord(self, levels, embeds_batch):
+        """POST a batch of embeds to the Discord webhook"""
         # Enhanced payload with better bot appearance
         payload = {
-            "embeds": [embed],
+            "embeds": embeds_batch,
             "username": f"🤖 {self.app_name}",
-            "avatar_url": "https://cdn.discordapp.com/emojis/1234567890123456789.png" if level == 'CRITICAL' else None
+            "avatar_url": "https://cdn.discordapp.com/emojis/1234567890123456789.png" if 'CRITICAL' in levels else None
         }
         
         try:
-            response = requests.post(
+            response = self._http.post(
                 self.discord_webhook_url,
-                json=payload,
+                data=_json_bytes(payload),
+                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
+            if response.status_code == 429:
+                self._requeue_after_rate_limit(response, levels, embeds_batch)
+                return
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             # Don't log Discord webhook failures to avoid infinite loops
             print(f"Failed to send log to Discord: {e}")
+            return
+        
+        # Out of requests in this rate-limit window: pause the worker (never the
+        # request threads) until it resets instead of running into a 429
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            time.sleep(_header_seconds(response, 'X-RateLimit-Reset-After', 0))
+    
+    def _requeue_after_rate_limit(self, response, levels, embeds_batch):
+        """Wait out a Discord 429 on the worker thread, then queue the batch again"""
+        time.sleep(_header_seconds(response, 'Retry-After', 1))
+        
+        for level, embed in zip(levels, embeds_batch):
+            try:
+                self._queue.put_nowait((level, embed))
+            except queue.Full:
+                self.discord_dropped += 1
+    
+    def _stop_discord_worker(self, timeout: float = 5.0):
+        """Flush pending Discord embeds and stop the worker on shutdown"""
+        try:
+            self._queue.put(_DISCORD_SENTINEL, timeout=timeout)
+        except queue.Full:
+            return
+        self._discord_thread.join(timeout)
+    
+    def is_enabled_for(self, level: int, send_to_discord: bool = False) -> bool:
+        """Check whether a record at this level would reach the log files or Discord"""
+        return self.logger.isEnabledFor(level) or (send_to_discord and self._discord_enabled)
     
-    def info(self, message: str, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = False):
-        """Log info message"""
-        self.logger.info(message, extra=extra_data or {})
-        if send_to_discord:
-            self._send_to_discord('INFO', message, extra_data)
+    def _log(self, level: int, message: str, args: tuple, extra_data: Optional[Dict[str, Any]],
+             send_to_discord: bool, timestamp: Optional[str] = None):
+        """Write a record to the log files and optionally forward it to Discord"""
+        self.logger.log(level, message, *args, extra=extra_data or {})
+        if send_to_discord and self._discord_enabled:
+            self._send_to_discord(logging.getLevelName(level), message % args if args else message,
+                                  extra_data, timestamp)
     
-    def warning(self, message: str, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
-        """Log warning message"""
-        self.logger.warning(message, extra=extra_data or {})
-        if send_to_discord:
-            self._send_to_discord('WARNING', message, extra_data)
+    def info(self, message: str, *args, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = False):
+        """Log info message; %-style args are only formatted when the record is emitted"""
+        self._log(logging.INFO, message, args, extra_data, send_to_discord)
     
-    def error(self, message: str, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
-        """Log error message"""
-        self.logger.error(message, extra=extra_data or {})
-        if send_to_discord:
-            self._send_to_discord('ERROR', message, extra_data)
+    def warning(self, message: str, *args, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
+        """Log warning message; %-style args are only formatted when the record is emitted"""
+        self._log(logging.WARNING, message, args, extra_data, send_to_discord)
     
-    def critical(self, message: str, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
-        """Log critical message"""
-        self.logger.critical(message, extra=extra_data or {})
-        if send_to_discord:
-            self._send_to_discord('CRITICAL', message, extra_data)
+    def error(self, message: str, *args, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
+        """Log error message; %-style args are only formatted when the record is emitted"""
+        self._log(logging.ERROR, message, args, extra_data, send_to_discord)
+    
+    def critical(self, message: str, *args, extra_data: Optional[Dict[str, Any]] = None, send_to_discord: bool = True):
+        """Log critical message; %-style args are only formatted when the record is emitted"""
+        self._log(logging.CRITICAL, message, args, extra_data, send_to_discord)
     
     def log_user_action(self, user_id: str, action: str, details: Optional[Dict[str, Any]] = None,
                        client_ip: Optional[str] = None):
         """Log user actions with structured data"""
+        if not self.is_enabled_for(logging.INFO):
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
         log_data = {
             'user_id': user_id,
             'action': action,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': timestamp,
             'client_ip': client_ip,
             **(details or {})
         }
-        message = f"User action: {action} by user {user_id}"
+        message = "User action: %s by user %s"
+        args = [action, user_id]
         if client_ip:
-            message += f" from {client_ip}"
-        self.info(message, extra_data=log_data)
+            message += " from %s"
+            args.append(client_ip)
+        self._log(logging.INFO, message, tuple(args), log_data, False, timestamp)
     
     def log_api_call(self, endpoint: str, method: str, status_code: int, 
                      user_id: Optional[str] = None, response_time: Optional[float] = None,
                      client_ip: Optional[str] = None):
         """Log API calls with performance metrics"""
+        # 4xx/5xx go to the error log; only server errors are worth a Discord alert
+        if status_code >= 400:
+            level, prefix, send_to_discord = logging.ERROR, "API Error: ", status_code >= 500
+        else:
+            level, prefix, send_to_discord = logging.INFO, "API Call: ", False
+        if not self.is_enabled_for(level, send_to_discord):
+            return
+        
         log_data = {
             'endpoint': endpoint,
             'method': method,
             'status_code': status_code,
             'user_id': user_id,
             'response_time_ms': response_time,
-            'client_ip': client_ip,
-            'timestamp': datetime.utcnow().isoformat()
+            'client_ip': client_ip
         }
         
-        message = f"{method} {endpoint} -> {status_code}"
+        message = "%s %s -> %s"
+        args = [method, endpoint, status_code]
         if response_time:
-            message += f" ({response_time:.2f}ms)"
+            message += " (%.2fms)"
+            args.append(response_time)
         if client_ip:
-            message += f" from {client_ip}"
+            message += " from %s"
+            args.append(client_ip)
         
-        if status_code >= 400:
-            self.error(f"API Error: {message}", extra_data=log_data)
-        else:
-            self.info(f"API Call: {message}", extra_data=log_data)
+        self._log(level, prefix + message, tuple(args), log_data, send_to_discord)
     
     def log_twilio_event(self, event_type: str, call_sid: Optional[str] = None, 
                         status: Optional[str] = None, error: Optional[str] = None):
         """Log Twilio-related events"""
+        # Errors are logged at ERROR and sent to Discord
+        if not self.is_enabled_for(logging.ERROR if error else logging.INFO, bool(error)):
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
         log_data = {
             'event_type': event_type,
             'call_sid': call_sid,
             'status': status,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp
         }
         
         if error:
             log_data['error'] = error
-            self.error(f"Twilio Error: {event_type} - {error}", extra_data=log_data, send_to_discord=True)
+            self._log(logging.ERROR, "Twilio Error: %s - %s", (event_type, error), log_data, True, timestamp)
         else:
-            message = f"Twilio Event: {event_type}"
+            message = "Twilio Event: %s"
+            args = [event_type]
             if status:
-                message += f" (Status: {status})"
-            self.info(message, extra_data=log_data)
+                message += " (Status: %s)"
+                args.append(status)
+            self._log(logging.INFO, message, tuple(args), log_data, False, timestamp)
     
     def log_system_event(self, event: str, details: Optional[Dict[str, Any]] = None, 
                         level: str = 'info', send_to_discord: bool = False):
         """Log system events (startup, shutdown, etc.)"""
+        # Callers pass lowercase names, so only fold case on a miss
+        log_level = _SYSTEM_EVENT_LEVELS.get(level) or _SYSTEM_EVENT_LEVELS.get(level.lower(), logging.INFO)
+        if not self.is_enabled_for(log_level, send_to_discord):
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
         log_data = {
             'event': event,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': timestamp,
             **(details or {})
         }
         
-        message = f"System Event: {event}"
-        
-        if level.lower() == 'error':
-            self.error(message, extra_data=log_data, send_to_discord=send_to_discord)
-        elif level.lower() == 'warning':
-            self.warning(message, extra_data=log_data, send_to_discord=send_to_discord)
-        elif level.lower() == 'critical':
-            self.critical(message, extra_data=log_data, send_to_discord=send_to_discord)
-        else:
-            self.info(message, extra_data=log_data, send_to_discord=send_to_discord)
+        message = "System Event: %s"
+        self._log(log_level, message, (event,), log_data, send_to_discord, timestamp)
 
 # Global logger instance
 app_logger = DiscordLogger()
\ No newline at end of file
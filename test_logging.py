@@ -5,14 +5,18 @@ Run this to test file logging and Discord webhook integration
 """
 import os
 import sys
-import time
+from pathlib import Path
 from dotenv import load_dotenv
 
+_HERE = Path(__file__).resolve().parent
+_LOGS_DIR = _HERE / 'logs'
+
 # Add the current directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, str(_HERE))
 
-# Load environment variables
+# Load environment variables once; the logger reads its own config at import
 load_dotenv()
+_DISCORD_URL = os.environ.get('DISCORD_WEBHOOK_URL')
 
 from services.logger_service import app_logger
 from utils.ip_utils import get_ip_info
@@ -103,17 +107,18 @@ def test_ip_utilities():
         "invalid-ip",       # Invalid IP
     ]
     
-    for ip in test_ips:
-        info = get_ip_info(ip)
-        print(f"   IP: {ip:15} -> Type: {info['type']:8} Version: {info.get('version', 'N/A')}")
+    rows = [
+        f"   IP: {ip:15} -> Type: {info.type:8} Version: {info.version or 'N/A'}"
+        for ip, info in zip(test_ips, map(get_ip_info, test_ips))
+    ]
+    print("\n".join(rows))
     
     print("✅ IP utility test completed.")
 
-def test_discord_integration():
+def test_discord_integration(discord_webhook=_DISCORD_URL):
     """Test Discord webhook integration"""
     print("🧪 Testing Discord integration...")
     
-    discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
     if not discord_webhook:
         print("⚠️  DISCORD_WEBHOOK_URL not set. Discord integration test skipped.")
         print("   To test Discord integration:")
@@ -122,14 +127,12 @@ def test_discord_integration():
         print("   3. Run this test again")
         return
     
-    # Test Discord notifications
+    # Test Discord notifications (batched and rate limited by the logger's worker)
     app_logger.info("Discord test: Info message", send_to_discord=True)
-    time.sleep(1)  # Rate limit prevention
     
     app_logger.warning("Discord test: Warning message", 
                       extra_data={"test_type": "discord_warning"}, 
                       send_to_discord=True)
-    time.sleep(1)
     
     app_logger.error("Discord test: Error message", 
                     extra_data={"test_type": "discord_error", "severity": "high"}, 
@@ -142,8 +145,7 @@ def main():
     print("🚀 Starting logging system tests...\n")
     
     # Check if logs directory will be created
-    logs_dir = os.path.join(os.path.dirname(__file__), 'logs')
-    print(f"📁 Logs will be saved to: {logs_dir}")
+    print(f"📁 Logs will be saved to: {_LOGS_DIR}")
     
     # Run tests
     test_basic_logging()
@@ -164,24 +166,30 @@ def main():
     test_ip_utilities()
     print()
     
-    test_discord_integration()
+    test_discord_integration(_DISCORD_URL)
     print()
     
-    print("🎉 All logging tests completed!")
-    print(f"\n📋 Results:")
-    print(f"   • Check {logs_dir}/app.log for general application logs")
-    print(f"   • Check {logs_dir}/errors.log for error logs only")
-    print(f"   • Check your Discord channel for webhook messages (if configured)")
+    # Collect the summary and write it in one go
+    lines = [
+        "🎉 All logging tests completed!",
+        "\n📋 Results:",
+        f"   • Check {_LOGS_DIR / 'app.log'} for general application logs",
+        f"   • Check {_LOGS_DIR / 'errors.log'} for error logs only",
+        "   • Check your Discord channel for webhook messages (if configured)",
+    ]
     
-    # Show log files if they exist
-    if os.path.exists(logs_dir):
-        log_files = [f for f in os.listdir(logs_dir) if f.endswith('.log')]
+    # Show log files if they exist, once the queued records have been written
+    app_logger.flush()
+    if _LOGS_DIR.exists():
+        # scandir entries carry their own stat, avoiding a join + getsize per file
+        with os.scandir(_LOGS_DIR) as it:
+            log_files = sorted((e.name, e.stat().st_size) for e in it if e.name.endswith('.log'))
         if log_files:
-            print(f"\n📄 Generated log files:")
-            for file in sorted(log_files):
-                file_path = os.path.join(logs_dir, file)
-                size = os.path.getsize(file_path)
-                print(f"   • {file} ({size} bytes)")
+            lines.append("\n📄 Generated log files:")
+            lines.extend(f"   • {file} ({size} bytes)" for file, size in log_files)
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,49 @@
 from flask import request
+from functools import lru_cache
 import ipaddress
+import socket
+import re
+from typing import NamedTuple, Optional
+
+# Cheap shape checks that reject junk header values (e.g. "unknown") before validation;
+# dots are allowed in IPv6 for IPv4-mapped forms like ::ffff:1.2.3.4
+_IPV4_RE = re.compile(r'^(?:\d{1,3}\.){3}\d{1,3}$')
+_IPV6_RE = re.compile(r'^[0-9a-fA-F:.]+$')
+
+# Same check for get_ip_info, which also accepts scoped IPv6 (fe80::1%eth0)
+_IP_RE = re.compile(r'^(?:(?:\d{1,3}\.){3}\d{1,3}|[0-9a-fA-F:.]+(?:%[^%\s]+)?)$')
+
+class IPInfo(NamedTuple):
+    """Classification of an IP address (immutable, so cached results can be shared)"""
+    address: str
+    version: Optional[int]
+    type: str
+    is_private: bool = False
+    is_loopback: bool = False
+    is_multicast: bool = False
+    
+    def to_dict(self):
+        """Return the info as a plain dict, omitting the version when unknown"""
+        info = self._asdict()
+        if self.version is None:
+            del info['version']
+        return info
+
+# Returned for missing addresses
+_UNKNOWN_IP_INFO = IPInfo('unknown', None, 'unknown')
+
+# Proxy headers that may carry the client IP, in order of preference
+_PROXY_HEADERS = (
+    'X-Forwarded-For',
+    'X-Real-IP',
+    'X-Client-IP',
+    'CF-Connecting-IP',  # Cloudflare
+    'True-Client-IP',    # Cloudflare Enterprise
+    'X-Forwarded'
+)
+
+# WSGI environ keys for the headers above, so they can be read without Headers.get
+_PROXY_ENV_KEYS = tuple('HTTP_' + header.upper().replace('-', '_') for header in _PROXY_HEADERS)
 
 def get_client_ip():
     """
@@ -10,83 +54,96 @@ def get_client_ip():
     # But we'll implement a fallback strategy for additional reliability
     
     # First, try the remote_addr (should be set correctly by ProxyFix)
-    if request.remote_addr:
-        try:
-            # Validate IP address
-            ipaddress.ip_address(request.remote_addr)
-            # Skip local/private IPs if we have better options
-            if not _is_private_ip(request.remote_addr):
-                return request.remote_addr
-        except (ipaddress.AddressValueError, ValueError):
-            pass
+    # Validate IP address, skipping local/private IPs if we have better options
+    remote_addr = request.remote_addr
+    if remote_addr and _is_private_ip(remote_addr) is False:
+        return remote_addr
     
     # Fallback: Check common proxy headers in order of preference
-    headers_to_check = [
-        'X-Forwarded-For',
-        'X-Real-IP',
-        'X-Client-IP',
-        'CF-Connecting-IP',  # Cloudflare
-        'True-Client-IP',    # Cloudflare Enterprise
-        'X-Forwarded'
-    ]
-    
-    for header in headers_to_check:
-        header_value = request.headers.get(header)
+    env = request.environ
+    for env_key in _PROXY_ENV_KEYS:
+        header_value = env.get(env_key)
         if header_value:
             # X-Forwarded-For can contain multiple IPs (client, proxy1, proxy2)
             # Take the first (leftmost) IP as it's usually the original client
-            ip = header_value.split(',')[0].strip()
-            
-            try:
-                # Validate IP address
-                ipaddress.ip_address(ip)
-                # Prefer public IPs over private ones
-                if not _is_private_ip(ip):
-                    return ip
-            except (ipaddress.AddressValueError, ValueError):
+            ip = header_value.partition(',')[0].strip()
+            if not (_IPV4_RE.match(ip) or _IPV6_RE.match(ip)):
                 continue
+            
+            # Validate IP address, preferring public IPs over private ones
+            if _is_private_ip(ip) is False:
+                return ip
     
     # Last resort: return remote_addr even if it's private/local
-    return request.remote_addr or 'unknown'
+    return remote_addr or 'unknown'
 
+# One parse both validates and classifies; cached since the same addresses recur
+@lru_cache(maxsize=2048)
 def _is_private_ip(ip_str):
-    """Check if an IP address is private/local"""
+    """Check if an IP address is private/local/reserved, returning None if it isn't valid"""
+    # inet_pton is native and much cheaper than building an ipaddress object
     try:
-        ip = ipaddress.ip_address(ip_str)
-        return ip.is_private or ip.is_loopback or ip.is_link_local
-    except (ipaddress.AddressValueError, ValueError):
-        return False
+        return _is_private_ipv4(int.from_bytes(socket.inet_pton(socket.AF_INET, ip_str), 'big'))
+    except (OSError, ValueError):
+        pass
+    try:
+        n = int.from_bytes(socket.inet_pton(socket.AF_INET6, ip_str), 'big')
+    except (OSError, ValueError):
+        return None
+    if n >> 32 == 0xFFFF:  # IPv4-mapped (::ffff:a.b.c.d)
+        return _is_private_ipv4(n & 0xFFFFFFFF)
+    return (
+        n <= 1                    # :: and ::1
+        or n >> 118 == 0x3FA      # fe80::/10
+        or n >> 121 == 0x7E       # fc00::/7
+    )
+
+def _is_private_ipv4(n):
+    """Check a 32-bit IPv4 address for RFC 1918, loopback, link-local or reserved ranges"""
+    return (
+        n >> 24 == 0              # 0.0.0.0/8 (unspecified, "this network")
+        or n >> 24 == 10          # 10.0.0.0/8
+        or n >> 24 == 127         # 127.0.0.0/8
+        or n >> 20 == 0xAC1       # 172.16.0.0/12
+        or n >> 16 == 0xC0A8      # 192.168.0.0/16
+        or n >> 16 == 0xA9FE      # 169.254.0.0/16
+        or n >> 28 == 0xF         # 240.0.0.0/4 (reserved, incl. 255.255.255.255)
+    )
 
 def get_ip_info(ip_address):
-    """Get additional information about an IP address"""
+    """Get additional information about an IP address as an IPInfo"""
     if not ip_address or ip_address == 'unknown':
-        return {'type': 'unknown'}
+        return _UNKNOWN_IP_INFO
+    
+    # Reject obvious junk up front, keeping it out of the parser and the cache
+    if not _IP_RE.match(ip_address):
+        return IPInfo(ip_address, None, 'invalid')
     
+    return _lookup_ip_info(ip_address)
+
+@lru_cache(maxsize=2048)
+def _lookup_ip_info(ip_address):
+    """Classify an IP address; cached because client IPs repeat constantly"""
     try:
         ip = ipaddress.ip_address(ip_address)
-        
-        info = {
-            'address': ip_address,
-            'version': ip.version,
-            'is_private': ip.is_private,
-            'is_loopback': ip.is_loopback,
-            'is_multicast': ip.is_multicast,
-        }
-        
-        # Determine IP type
-        if ip.is_loopback:
-            info['type'] = 'loopback'
-        elif ip.is_private:
-            info['type'] = 'private'
-        elif ip.is_multicast:
-            info['type'] = 'multicast'
-        else:
-            info['type'] = 'public'
-            
-        return info
-        
     except (ipaddress.AddressValueError, ValueError):
-        return {
-            'address': ip_address,
-            'type': 'invalid'
-        }
\ No newline at end of file
+        return IPInfo(ip_address, None, 'invalid')
+    
+    # Determine IP type
+    if ip.is_loopback:
+        ip_type = 'loopback'
+    elif ip.is_private:
+        ip_type = 'private'
+    elif ip.is_multicast:
+        ip_type = 'multicast'
+    else:
+        ip_type = 'public'
+    
+    return IPInfo(
+        address=ip_address,
+        version=ip.version,
+        type=ip_type,
+        is_private=ip.is_private,
+        is_loopback=ip.is_loopback,
+        is_multicast=ip.is_multicast,
+    )
\ No newline at end of file